@@ -24,6 +24,7 @@ from dataclasses import dataclass, field
 from functools import partial, wraps
 from json.decoder import JSONDecodeError
 from pathlib import Path
+from time import time_ns
 from typing import (
     Any,
     AsyncIterable,
@@ -1254,16 +1255,14 @@ class AsyncClient(Client):
         # TODO: Doc comment
         """Request a interactive key verification from every active device of this user.
 
-        Returns either a `ToDeviceResponse` if the request was successful or
-        a `ToDeviceError` if there was an error with the request.
-
-        Args:
-            device (OlmDevice): An device with which we would like to start the
-                interactive key verification process.
+        A single verification process is created for every device and all of
+        the requests share the same timestamp.
         """
+        timestamp = time_ns() // 1_000_000
+
         for device in self.device_store.active_user_devices(self.user_id):
-            message = self.create_key_verification_request(device)
-            await self.request_key_verification(device)
+            message = self.create_key_verification_request(device, timestamp)
+            await self.to_device(message)
 
     @logged_in_async
     @store_loaded
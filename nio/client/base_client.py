@@ -1349,17 +1349,22 @@ class Client:
         self.presence_callbacks.append(cb)
 
     @store_loaded
-    def create_key_verification_request(self, device: OlmDevice) -> ToDeviceMessage:
+    def create_key_verification_request(
+        self, device: OlmDevice, timestamp: Optional[int] = None
+    ) -> ToDeviceMessage:
         """Request a new key verification process with the given device.
 
         Args:
             device (OlmDevice): The device which we would like to verify
+            timestamp (int, optional): The time in milliseconds since the
+                epoch at which the request is sent. The current time will be
+                used if one isn't provided.
 
         Returns a ``ToDeviceMessage`` that should be sent to to the homeserver.
         """
         assert self.olm
         sas = self.olm.create_sas(device)
-        return sas.request_verification()
+        return sas.request_verification(timestamp)
 
     @store_loaded
     def create_key_verification(self, device: OlmDevice) -> ToDeviceMessage:
@@ -2103,14 +2103,20 @@ class Olm:
 
         Returns the object if it's found, otherwise None.
         """
-        verifications = [x for x in self.key_verifications.values() if not x.canceled]
+        newest = None
 
-        for sas in sorted(verifications, key=lambda x: x.creation_time, reverse=True):
+        for sas in self.key_verifications.values():
             device = sas.other_olm_device
-            if device.user_id == user_id and device.id == device_id:
-                return sas
+            if device.user_id != user_id or device.id != device_id:
+                continue
 
-        return None
+            if sas.canceled:
+                continue
+
+            if newest is None or sas.creation_time > newest.creation_time:
+                newest = sas
+
+        return newest
 
     def handle_key_verification(self, event):
         # type: (KeyVerificationEvent) -> None
@@ -16,12 +16,12 @@
 
 from __future__ import unicode_literals
 
+import secrets
 from builtins import bytes, super
 from datetime import datetime, timedelta
 from enum import Enum
 from time import time_ns
 from typing import List, Optional, Tuple
-from uuid import uuid4
 
 import olm
 from future.moves.itertools import zip_longest
@@ -79,10 +79,12 @@ class Sas(olm.Sas):
     """
 
     _sas_method_v1 = "m.sas.v1"
+    _methods_v1 = [_sas_method_v1]
     _key_agreement_v1 = "curve25519"
     _key_agreement_v2 = "curve25519-hkdf-sha256"
     _key_agreeemnt_protocols = [_key_agreement_v1, _key_agreement_v2]
     _hash_v1 = "sha256"
+    _hashes_v1 = [_hash_v1]
     _mac_normal = "hkdf-hmac-sha256"
     _mac_old = "hmac-sha256"
     _mac_v1 = [_mac_normal, _mac_old]
@@ -191,7 +193,7 @@ class Sas(olm.Sas):
 
         self.other_olm_device = other_olm_device
 
-        self.transaction_id = transaction_id or str(uuid4())
+        self.transaction_id = transaction_id or secrets.token_hex(16)
 
         self.short_auth_string = short_auth_string or ["emoji", "decimal"]
         self.mac_methods = mac_methods or Sas._mac_v1
@@ -417,13 +419,23 @@ class Sas(olm.Sas):
             int(x, 2) + 1000 for x in map("".join, list(self._grouper(number[:-1], 13)))
         )
 
-    def request_verification(self) -> ToDeviceMessage:
-        """Create a content dictionary to request the verification."""
+    def request_verification(self, timestamp: Optional[int] = None) -> ToDeviceMessage:
+        """Create a content dictionary to request the verification.
+
+        Args:
+            timestamp (int, optional): The time in milliseconds since the
+                epoch at which the request is sent. The current time will be
+                used if one isn't provided.
+
+        """
+        if timestamp is None:
+            timestamp = time_ns() // 1_000_000
+
         content = {
             "from_device": self.own_device,
-            "methods": [self._sas_method_v1],
+            "methods": self._methods_v1,
             "transaction_id": self.transaction_id,
-            "timestamp": time_ns() // 1_000_000,
+            "timestamp": timestamp,
         }
 
         message = ToDeviceMessage(
@@ -456,7 +468,7 @@ class Sas(olm.Sas):
             "method": self._sas_method_v1,
             "transaction_id": self.transaction_id,
             "key_agreement_protocols": Sas._key_agreeemnt_protocols,
-            "hashes": [self._hash_v1],
+            "hashes": self._hashes_v1,
             "message_authentication_codes": self._mac_v1,
             "short_authentication_string": self._strings_v1,
         }
@@ -669,8 +681,9 @@ class Sas(olm.Sas):
 
     def receive_key_event(self, event):
         """Receive a KeyVerificationKey event."""
-        if self.other_key_set or (
-            (self.state != SasState.started) and (self.state != SasState.accepted)
+        if self.other_key_set or self.state not in (
+            SasState.started,
+            SasState.accepted,
         ):
             self.state = SasState.canceled
             (
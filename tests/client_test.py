@@ -583,6 +583,23 @@ class TestClass:
         alice_device = client.device_store[ALICE_ID][ALICE_DEVICE_ID]
         assert alice_device
 
+    def test_key_verification_request(self, client):
+        client.receive_response(self.login_response)
+        client.receive_response(KeysUploadResponse(50, 50))
+        client.receive_response(self.sync_response)
+        client.receive_response(self.keys_query_response)
+
+        alice_device = client.device_store[ALICE_ID][ALICE_DEVICE_ID]
+        message = client.create_key_verification_request(alice_device, 1_000)
+
+        assert message.type == "m.key.verification.request"
+        assert message.recipient_device == ALICE_DEVICE_ID
+        assert message.content["timestamp"] == 1_000
+
+        sas = client.key_verifications[message.content["transaction_id"]]
+        assert sas.we_requested_it
+        assert client.get_active_sas(ALICE_ID, ALICE_DEVICE_ID) is sas
+
     def test_client_key_query(self, client):
         assert not client.should_query_keys
 
@@ -33,6 +33,21 @@ class TestClass:
         with pytest.raises(LocalProtocolError):
             alice.accept_verification()
 
+    def test_sas_request(self):
+        alice = Sas(alice_id, alice_device_id, alice_keys["ed25519"], bob_device)
+
+        message = alice.request_verification(timestamp=1_000)
+
+        assert alice.we_requested_it
+        assert message.type == "m.key.verification.request"
+        assert message.recipient == bob_id
+        assert message.recipient_device == bob_device_id
+        assert message.content["transaction_id"] == alice.transaction_id
+        assert message.content["timestamp"] == 1_000
+
+        message = alice.request_verification()
+        assert message.content["timestamp"] > 1_000
+
     def test_sas_start(self):
         alice = Sas(
             alice_id,
@@ -929,6 +944,22 @@ class TestClass:
         assert new_alice_sas
         assert not new_alice_sas.canceled
 
+    def test_get_active_sas_newest(self, olm_machine):
+        bob_device = olm_machine.device_store[bob_id][bob_device_id]
+
+        old_sas = olm_machine.create_sas(bob_device)
+        new_sas = olm_machine.create_sas(bob_device)
+        old_sas.creation_time -= timedelta(minutes=1)
+
+        assert olm_machine.get_active_sas(bob_id, bob_device_id) is new_sas
+        assert not olm_machine.get_active_sas(bob_id, "UNKNOWN")
+
+        new_sas.cancel()
+        assert olm_machine.get_active_sas(bob_id, bob_device_id) is old_sas
+
+        old_sas.cancel()
+        assert not olm_machine.get_active_sas(bob_id, bob_device_id)
+
     def test_client_sas_expiration(self, olm_machine):
         bob_device = olm_machine.device_store[bob_id][bob_device_id]
         olm_machine.create_sas(bob_device)